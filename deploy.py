@@ -5,27 +5,34 @@ SAM deployment script for CloudWatch S3 Reporting
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def execute_command(command):
+    """Run a command without printing; return the CompletedProcess or CalledProcessError"""
+    try:
+        return subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        return e
+
+def report_command(command, description, outcome):
+    """Print the header and result of a finished command; return True on success"""
     print(f"\n[INFO] {description}...")
     print(f"Command: {' '.join(command)}")
     
-    try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        print(f"[SUCCESS] {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
+    if isinstance(outcome, subprocess.CalledProcessError):
         print(f"[ERROR] {description} failed")
-        print(f"Error: {e}")
-        if e.stdout:
-            print(f"stdout: {e.stdout}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
+        print(f"Error: {outcome}")
+        if outcome.stdout:
+            print(f"stdout: {outcome.stdout}")
+        if outcome.stderr:
+            print(f"stderr: {outcome.stderr}")
         return False
+    
+    print(f"[SUCCESS] {description} completed successfully")
+    if outcome.stdout:
+        print(outcome.stdout)
+    return True
 
 def check_sam_cli():
     """Check if SAM CLI is installed"""
@@ -55,12 +62,20 @@ def main():
         print("Then edit samconfig.toml with your specific values")
         sys.exit(1)
     
-    # Validate template
-    if not run_command(["sam", "validate"], "Validating SAM template"):
-        sys.exit(1)
+    # Validate template and build application concurrently (build doesn't depend on validate).
+    # Output is printed after both finish, in validate-then-build order, so it doesn't interleave.
+    steps = [
+        (["sam", "validate"], "Validating SAM template"),
+        (["sam", "build"], "Building SAM application"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [executor.submit(execute_command, command) for command, _ in steps]
     
-    # Build application
-    if not run_command(["sam", "build"], "Building SAM application"):
+    results = [
+        report_command(command, description, future.result())
+        for (command, description), future in zip(steps, futures)
+    ]
+    if not all(results):
         sys.exit(1)
     
     # Deploy application
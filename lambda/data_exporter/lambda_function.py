@@ -1,21 +1,78 @@
+import gzip
 import json
+import logging
 import os
 import re
+import sys
 import boto3
-from datetime import datetime, timedelta
-from aws_lambda_powertools import Logger
-from aws_lambda_powertools.utilities.typing import LambdaContext
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 
-# Initialize logger with Powertools
-logger = Logger()
 
-# Initialize AWS clients (reporting account)
-s3 = boto3.client('s3')
-lambda_client = boto3.client('lambda')
-sns_client = boto3.client('sns')
-sts_client = boto3.client('sts')
-ssm_client = boto3.client('ssm')
+class JsonFormatter(logging.Formatter):
+    """Render log records as one-line JSON, merging in any fields passed via `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'level': record.levelname,
+            'location': f'{record.funcName}:{record.lineno}',
+            'message': record.getMessage(),
+            'timestamp': self.formatTime(record)
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _LOG_RECORD_ATTRS})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+# Attributes present on every LogRecord; anything else came in through `extra`
+_LOG_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Initialize structured JSON logger
+logger = logging.getLogger('data_exporter')
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(JsonFormatter())
+    logger.addHandler(_log_handler)
+
+# Shared client config: a larger connection pool so parallel metric fetches
+# don't serialize on botocore's default 10-connection pool,
+# and TCP keep-alive so warm invocations reuse established connections
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
+# Upper bound on concurrent CloudWatch requests per account/region
+MAX_FETCH_WORKERS = 16
+
+# GetMetricData query Id prefix -> statistic
+METRIC_STATISTICS = {'avg': 'Average', 'max': 'Maximum', 'min': 'Minimum'}
+
+# GetMetricData accepts at most 500 queries per call (one per instance/statistic)
+INSTANCES_PER_METRIC_DATA_CALL = 500 // len(METRIC_STATISTICS)
+
+# Initialize AWS clients (reporting account) from one shared session at import,
+# so warm invocations reuse them and their connection pools
+_SESSION = boto3.session.Session()
+s3 = _SESSION.client('s3', config=CLIENT_CONFIG)
+sns_client = _SESSION.client('sns', config=CLIENT_CONFIG)
+sts_client = _SESSION.client('sts', config=CLIENT_CONFIG)
+ssm_client = _SESSION.client('ssm', config=CLIENT_CONFIG)
+cloudwatch_client = _SESSION.client('cloudwatch', config=CLIENT_CONFIG)
+ec2_client = _SESSION.client('ec2', config=CLIENT_CONFIG)
+
+# Resolve the credential chain during init rather than on the first API call
+_credentials = _SESSION.get_credentials()
+if _credentials:
+    _credentials.get_frozen_credentials()
 
 # Validation patterns
 ACCOUNT_ID_PATTERN = re.compile(r'^\d{12}$')
@@ -181,80 +238,143 @@ def discover_instances(ec2_client, instance_filters: Optional[Dict[str, Any]] =
         return []
 
 
-def fetch_cloudwatch_metrics(instance_id: str, cw_client, account_id: str = 'local', region: str = 'local') -> Dict[str, Any]:
+def fetch_cloudwatch_metrics(instance_ids: List[str], cw_client, now: datetime, account_id: str = 'local', region: str = 'local') -> List[Dict[str, Any]]:
     """
-    Fetch CPU utilization metrics for a specific EC2 instance.
+    Fetch CPU utilization metrics for a batch of EC2 instances with GetMetricData.
+
+    One query is issued per (instance, statistic), so a whole batch is served by
+    a single API call instead of one GetMetricStatistics call per instance.
 
     Args:
-        instance_id: EC2 instance ID
+        instance_ids: EC2 instance IDs (at most INSTANCES_PER_METRIC_DATA_CALL)
         cw_client: boto3 CloudWatch client (local or cross-account)
+        now: Invocation timestamp; metrics are fetched from the 1st of its month up to it
         account_id: Source account ID for labeling
         region: Source region for labeling
 
     Returns:
-        Dict containing metrics data for the instance
+        List of metrics dicts, one per instance, in the same order as instance_ids
     """
-    try:
-        today = datetime.now()
-        first_day_current_month = today.replace(day=1)
+    first_day_current_month = now.replace(day=1)
+    month = first_day_current_month.strftime('%Y-%m')
 
+    try:
         logger.info("Fetching CloudWatch metrics", extra={
-            "instance_id": instance_id,
+            "instance_count": len(instance_ids),
             "account_id": account_id,
             "region": region,
             "start_time": first_day_current_month.isoformat(),
-            "end_time": today.isoformat()
+            "end_time": now.isoformat()
         })
 
-        response = cw_client.get_metric_statistics(
-            Namespace='AWS/EC2',
-            MetricName='CPUUtilization',
-            Dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-            StartTime=first_day_current_month,
-            EndTime=today,
-            Period=86400,
-            Statistics=['Average', 'Maximum', 'Minimum']
-        )
+        queries = []
+        for i, instance_id in enumerate(instance_ids):
+            for prefix, stat in METRIC_STATISTICS.items():
+                queries.append({
+                    'Id': f'{prefix}_{i}',
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/EC2',
+                            'MetricName': 'CPUUtilization',
+                            'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                        },
+                        'Period': 86400,
+                        'Stat': stat
+                    },
+                    'ReturnData': True
+                })
 
-        cpu_data = []
-        for datapoint in sorted(response['Datapoints'], key=lambda x: x['Timestamp']):
-            cpu_data.append({
-                'timestamp': datapoint['Timestamp'].strftime('%Y-%m-%d'),
-                'average': round(datapoint['Average'], 2),
-                'maximum': round(datapoint['Maximum'], 2),
-                'minimum': round(datapoint['Minimum'], 2)
+        # Results for a query may be split across pages, so accumulate per Id
+        series = {query['Id']: ([], []) for query in queries}
+        paginator = cw_client.get_paginator('get_metric_data')
+        for page in paginator.paginate(
+            MetricDataQueries=queries,
+            StartTime=first_day_current_month,
+            EndTime=now,
+            ScanBy='TimestampAscending'
+        ):
+            for result in page['MetricDataResults']:
+                timestamps, values = series[result['Id']]
+                timestamps.extend(result['Timestamps'])
+                values.extend(result['Values'])
+
+        all_metrics = []
+        for i, instance_id in enumerate(instance_ids):
+            # Pivot the per-statistic series back into one row per day. Series
+            # arrive oldest-first (ScanBy=TimestampAscending), so no re-sort is needed.
+            average = dict(zip(*series[f'avg_{i}']))
+            maximum = dict(zip(*series[f'max_{i}']))
+            minimum = dict(zip(*series[f'min_{i}']))
+
+            cpu_data = [
+                {
+                    'timestamp': timestamp.strftime('%Y-%m-%d'),
+                    'average': round(avg, 2),
+                    'maximum': round(maximum[timestamp], 2),
+                    'minimum': round(minimum[timestamp], 2)
+                }
+                for timestamp, avg in average.items()
+                if timestamp in maximum and timestamp in minimum
+            ]
+
+            all_metrics.append({
+                'instance_id': instance_id,
+                'account_id': account_id,
+                'region': region,
+                'cpu_data': cpu_data,
+                'month': month
             })
 
         logger.info("Successfully fetched metrics", extra={
-            "instance_id": instance_id,
-            "datapoints_count": len(cpu_data)
+            "instance_count": len(instance_ids),
+            "datapoints_count": sum(len(m['cpu_data']) for m in all_metrics)
         })
-
-        return {
-            'instance_id': instance_id,
-            'account_id': account_id,
-            'region': region,
-            'cpu_data': cpu_data,
-            'month': first_day_current_month.strftime('%Y-%m')
-        }
+        return all_metrics
 
     except Exception as e:
         logger.error("Error fetching CloudWatch metrics", extra={
-            "instance_id": instance_id,
+            "instance_ids": instance_ids,
             "account_id": account_id,
             "error": str(e)
         })
-        return {
+        return [{
             'instance_id': instance_id,
             'account_id': account_id,
             'region': region,
             'cpu_data': [],
-            'month': datetime.now().strftime('%Y-%m'),
+            'month': month,
             'error': str(e)
-        }
+        } for instance_id in instance_ids]
+
+
+def fetch_metrics_parallel(instance_ids: List[str], cw_client, now: datetime, account_id: str = 'local', region: str = 'local') -> List[Dict[str, Any]]:
+    """
+    Fetch CPU utilization metrics for many instances concurrently.
+
+    Instances are split into GetMetricData-sized batches and the batches are
+    fetched on a thread pool. boto3 clients are thread-safe, so cw_client is shared.
+
+    Returns:
+        List of metrics dicts in the same order as instance_ids
+    """
+    if not instance_ids:
+        return []
+
+    batches = [
+        instance_ids[i:i + INSTANCES_PER_METRIC_DATA_CALL]
+        for i in range(0, len(instance_ids), INSTANCES_PER_METRIC_DATA_CALL)
+    ]
+
+    max_workers = min(MAX_FETCH_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda batch: fetch_cloudwatch_metrics(batch, cw_client, now, account_id, region),
+            batches
+        )
+        return [metrics for batch_metrics in results for metrics in batch_metrics]
 
 
-def fetch_metrics_for_account(account: Dict[str, Any], role_name: str, external_id: str) -> List[Dict[str, Any]]:
+def fetch_metrics_for_account(account: Dict[str, Any], role_name: str, external_id: str, now: datetime) -> List[Dict[str, Any]]:
     """
     Fetch metrics from all regions of a single workload account.
 
@@ -262,6 +382,7 @@ def fetch_metrics_for_account(account: Dict[str, Any], role_name: str, external_
         account: Account dict with account_id, regions, and optional alias
         role_name: Cross-account IAM role name
         external_id: External ID for STS assume role
+        now: Invocation timestamp
 
     Returns:
         List of metrics dicts for all instances in the account
@@ -282,13 +403,12 @@ def fetch_metrics_for_account(account: Dict[str, Any], role_name: str, external_
     for region in regions:
         try:
             session = assume_cross_account_role(account_id, role_name, external_id, region)
-            cw_client = session.client('cloudwatch')
-            ec2_client = session.client('ec2')
+            cw_client = session.client('cloudwatch', config=CLIENT_CONFIG)
+            account_ec2_client = session.client('ec2', config=CLIENT_CONFIG)
 
-            instance_ids = discover_instances(ec2_client, instance_filters)
+            instance_ids = discover_instances(account_ec2_client, instance_filters)
 
-            for instance_id in instance_ids:
-                metrics = fetch_cloudwatch_metrics(instance_id, cw_client, account_id, region)
+            for metrics in fetch_metrics_parallel(instance_ids, cw_client, now, account_id, region):
                 metrics['account_alias'] = alias
                 all_metrics.append(metrics)
 
@@ -306,25 +426,26 @@ def fetch_metrics_for_account(account: Dict[str, Any], role_name: str, external_
     return all_metrics
 
 
-def store_in_s3(metrics_data: List[Dict[str, Any]], bucket_name: str) -> str:
+def store_in_s3(metrics_data: List[Dict[str, Any]], bucket_name: str, now: datetime) -> str:
     """
     Store metrics data in S3 with year-month key structure.
 
     Args:
         metrics_data: List of metrics data for all instances
         bucket_name: S3 bucket name
+        now: Invocation timestamp, used for the month key and export_timestamp
 
     Returns:
         str: S3 key where data was stored
     """
     try:
-        current_month = datetime.now().strftime('%Y-%m')
+        current_month = now.strftime('%Y-%m')
         if metrics_data and metrics_data[0].get('month'):
             current_month = metrics_data[0]['month']
 
         data_structure = {
             'month': current_month,
-            'export_timestamp': datetime.now().isoformat(),
+            'export_timestamp': now.isoformat(),
             'instances': metrics_data
         }
 
@@ -339,8 +460,9 @@ def store_in_s3(metrics_data: List[Dict[str, Any]], bucket_name: str) -> str:
         s3.put_object(
             Bucket=bucket_name,
             Key=s3_key,
-            Body=json.dumps(data_structure, indent=2),
-            ContentType='application/json'
+            Body=gzip.compress(json.dumps(data_structure, separators=(',', ':')).encode('utf-8'), compresslevel=6),
+            ContentType='application/json',
+            ContentEncoding='gzip'
         )
 
         logger.info("Successfully stored data in S3", extra={
@@ -357,50 +479,7 @@ def store_in_s3(metrics_data: List[Dict[str, Any]], bucket_name: str) -> str:
         raise
 
 
-def invoke_report_generator(s3_key: str, bucket_name: str, report_generator_function_name: str) -> Dict[str, Any]:
-    """
-    Invoke Report Generator Lambda function asynchronously.
-    """
-    try:
-        payload = {
-            'bucket_name': bucket_name,
-            's3_key': s3_key,
-            'source': 'data_exporter'
-        }
-
-        logger.info("Invoking Report Generator Lambda", extra={
-            "function_name": report_generator_function_name,
-            "payload": payload
-        })
-
-        response = lambda_client.invoke(
-            FunctionName=report_generator_function_name,
-            InvocationType='Event',
-            Payload=json.dumps(payload)
-        )
-
-        logger.info("Successfully invoked Report Generator", extra={
-            "function_name": report_generator_function_name,
-            "status_code": response['StatusCode']
-        })
-
-        return {
-            'invocation_status': 'success',
-            'status_code': response['StatusCode']
-        }
-
-    except Exception as e:
-        logger.error("Error invoking Report Generator Lambda", extra={
-            "function_name": report_generator_function_name,
-            "error": str(e)
-        })
-        return {
-            'invocation_status': 'failed',
-            'error': str(e)
-        }
-
-
-def send_process_start_notification(target_accounts: List[Dict[str, Any]]):
+def send_process_start_notification(target_accounts: List[Dict[str, Any]], now: datetime):
     """
     Send SNS notification when the monthly process starts.
     """
@@ -419,7 +498,7 @@ def send_process_start_notification(target_accounts: List[Dict[str, Any]]):
 CloudWatch metrics data export process has started.
 
 Process Details:
-- Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+- Started: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}
 - Target Month: Current month's data
 - Target Accounts: {account_list}
 - Process: Automated monthly export
@@ -460,13 +539,13 @@ Export Details:
 - Data Location: {s3_key}
 - Accounts Processed: {accounts_count}
 - Instances Processed: {instances_count}
-- Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+- Completed: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
 
 The Report Generator has been triggered and will create an HTML report shortly.
 You will receive another notification when the report is ready.
 
-You can access the raw data using:
-aws s3 cp s3://{bucket_name}/{s3_key} ./metrics.json
+You can access the raw data (stored gzip-compressed) using:
+aws s3 cp s3://{bucket_name}/{s3_key} - | gunzip > metrics.json
 
 This is an automated message from the CloudWatch Reporting System.
         """
@@ -482,16 +561,20 @@ This is an automated message from the CloudWatch Reporting System.
         logger.error("Error sending export success notification", extra={"error": str(e)})
 
 
-def lambda_handler(event: dict, context: LambdaContext) -> dict:
+def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main Lambda handler for CloudWatch Data Exporter.
 
     Reads the target accounts registry from SSM, assumes cross-account roles,
-    discovers instances, fetches CloudWatch metrics, stores results in S3,
-    and triggers the Report Generator.
+    discovers instances, fetches CloudWatch metrics, and stores results in S3.
+    Writing the metrics file triggers the Report Generator via an S3 event.
     """
     logger.info("Starting CloudWatch Data Exporter", extra={"event": event})
 
+    # One timestamp for the whole run so the metrics window, S3 month key, and
+    # notifications all agree even if the invocation straddles midnight
+    now = datetime.now(timezone.utc)
+
     try:
         trigger_source = event.get('source', 'unknown')
         schedule_mode = event.get('schedule', 'unknown')
@@ -510,26 +593,24 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict:
         target_accounts = get_target_accounts()
 
         # Send process start notification
-        send_process_start_notification(target_accounts)
+        send_process_start_notification(target_accounts, now)
 
         all_metrics_data = []
 
         # Fetch metrics from each workload account
         for account in target_accounts:
-            account_metrics = fetch_metrics_for_account(account, role_name, external_id)
+            account_metrics = fetch_metrics_for_account(account, role_name, external_id, now)
             all_metrics_data.extend(account_metrics)
 
         # If no cross-account targets configured, fall back to local account
         if not target_accounts:
             logger.info("No cross-account targets, fetching from local account")
-            local_cw = boto3.client('cloudwatch')
-            local_ec2 = boto3.client('ec2')
             local_account = sts_client.get_caller_identity()['Account']
 
-            instance_ids = discover_instances(local_ec2)
-            for instance_id in instance_ids:
-                metrics = fetch_cloudwatch_metrics(instance_id, local_cw, local_account, os.environ.get('AWS_REGION', 'us-east-1'))
-                all_metrics_data.append(metrics)
+            instance_ids = discover_instances(ec2_client)
+            all_metrics_data.extend(fetch_metrics_parallel(
+                instance_ids, cloudwatch_client, now, local_account, os.environ.get('AWS_REGION', 'us-east-1')
+            ))
 
         logger.info("CloudWatch metrics fetching completed", extra={
             "total_instances": len(all_metrics_data),
@@ -542,26 +623,21 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict:
                                      event.get('bucket_name',
                                                event.get('bucket', 'demo-cloudwatch-reports')))
 
-        s3_key = store_in_s3(all_metrics_data, bucket_name)
+        s3_key = store_in_s3(all_metrics_data, bucket_name, now)
 
-        # Send success notification
+        # Send success notification; the S3 ObjectCreated event on the
+        # metrics file triggers the Report Generator
         send_export_success_notification(s3_key, bucket_name, len(all_metrics_data), len(target_accounts) or 1)
 
-        # Trigger report generation
-        stack_name = context.function_name.rsplit('-', 1)[0] if '-' in context.function_name else 'cloudwatch-s3-reporting'
-        report_generator_function_name = event.get('report_generator_function_name', f'{stack_name}-ReportGenerator')
-        invocation_result = invoke_report_generator(s3_key, bucket_name, report_generator_function_name)
-
         return {
             'statusCode': 200,
             'body': json.dumps({
-                'message': 'Data export and report generation initiated successfully',
+                'message': 'Data export completed successfully; report generation is triggered by S3',
                 'request_id': context.aws_request_id,
                 's3_key': s3_key,
                 'bucket_name': bucket_name,
                 'instances_processed': len(all_metrics_data),
-                'accounts_processed': len(target_accounts) or 1,
-                'report_generator_invocation': invocation_result
+                'accounts_processed': len(target_accounts) or 1
             })
         }
 
@@ -1,28 +1,119 @@
+import gzip
+import io
 import json
+import logging
+import statistics
+import sys
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import os
+from collections import defaultdict
 from datetime import datetime
-from aws_lambda_powertools import Logger
-import pandas as pd
-import tempfile
+from html import escape
+from urllib.parse import unquote_plus
 
-# Initialize logger
-logger = Logger()
 
-# Initialize AWS clients
-s3_client = boto3.client('s3')
-sns_client = boto3.client('sns')
+class JsonFormatter(logging.Formatter):
+    """Render log records as one-line JSON, merging in any fields passed via `extra`."""
+
+    def format(self, record):
+        entry = {
+            'level': record.levelname,
+            'location': f'{record.funcName}:{record.lineno}',
+            'message': record.getMessage(),
+            'timestamp': self.formatTime(record)
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _LOG_RECORD_ATTRS})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+# Attributes present on every LogRecord; anything else came in through `extra`
+_LOG_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Initialize structured JSON logger
+logger = logging.getLogger('report_generator')
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(JsonFormatter())
+    logger.addHandler(_log_handler)
+
+# Shared client config for all AWS clients; TCP keep-alive lets warm
+# invocations reuse established connections
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
+# Initialize AWS clients from one shared session at import,
+# so warm invocations reuse them and their connection pools
+_SESSION = boto3.session.Session()
+s3_client = _SESSION.client('s3', config=CLIENT_CONFIG)
+sns_client = _SESSION.client('sns', config=CLIENT_CONFIG)
+
+# Large reports are uploaded as parallel multipart parts; anything below the
+# threshold still goes up as a single PutObject
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Resolve the credential chain during init rather than on the first API call
+_credentials = _SESSION.get_credentials()
+if _credentials:
+    _credentials.get_frozen_credentials()
+
+# Static parts of the HTML report, encoded once at import. The page title
+# (report month) is spliced in between _HTML_HEAD_START and _HTML_HEAD_END.
+_HTML_HEAD_START = b"""<!DOCTYPE html>
+<html>
+<head>
+    <title>CloudWatch CPU Utilization Report - """
+
+_HTML_HEAD_END = b"""</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        h1 { color: #232F3E; text-align: center; }
+        h2 { color: #FF9900; border-bottom: 2px solid #FF9900; padding-bottom: 5px; }
+        h3 { color: #232F3E; margin-top: 30px; }
+        .summary { background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0; }
+        .account-section { border-left: 4px solid #FF9900; padding-left: 20px; margin: 30px 0; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
+        th { background-color: #232F3E; color: white; }
+        tr:nth-child(even) { background-color: #f2f2f2; }
+        .metric { display: inline-block; margin: 10px 20px; }
+        .account-header { background-color: #232F3E; color: white; padding: 10px 20px; border-radius: 5px 5px 0 0; margin-top: 30px; }
+    </style>
+</head>
+<body>
+    <h1>CloudWatch CPU Utilization Report</h1>
+"""
+
+_HTML_TAIL = b"""</body>
+</html>"""
 
 
 def lambda_handler(event, context):
     """
-    Lambda handler for Report Generator using AWS built-in layers.
+    Lambda handler for Report Generator.
+
+    Triggered by the S3 ObjectCreated event for data/*/metrics.json, or invoked
+    directly with a {"bucket_name": ..., "s3_key": ...} payload for manual runs.
     """
     logger.info("Report Generator Lambda started", extra={"event": event})
 
     try:
-        bucket_name = event.get('bucket_name') or os.environ.get('S3_BUCKET_NAME')
-        data_key = event.get('s3_key')
+        bucket_name, data_key = get_data_location(event)
 
         if not bucket_name or not data_key:
             raise ValueError("Missing required parameters: bucket_name or s3_key")
@@ -32,7 +123,7 @@ def lambda_handler(event, context):
             "data_key": data_key
         })
 
-        report_key = generate_pandas_report(bucket_name, data_key)
+        report_key = generate_report(bucket_name, data_key)
         send_notification(bucket_name, report_key, success=True)
 
         logger.info("Report generation completed successfully", extra={"report_key": report_key})
@@ -58,24 +149,38 @@ def lambda_handler(event, context):
         }
 
 
-def generate_pandas_report(bucket_name, data_key):
-    """Generate HTML report using pandas for data processing."""
+def get_data_location(event):
+    """Return (bucket_name, data_key) from an S3 event notification or a direct invocation payload."""
+    records = event.get('Records')
+    if records:
+        s3_info = records[0]['s3']
+        # Object keys in S3 event notifications are URL-encoded
+        return s3_info['bucket']['name'], unquote_plus(s3_info['object']['key'])
+
+    return event.get('bucket_name') or os.environ.get('S3_BUCKET_NAME'), event.get('s3_key')
+
+
+def generate_report(bucket_name, data_key):
+    """Generate HTML report from the exported metrics data."""
     metrics_data = download_metrics_data(bucket_name, data_key)
-    df = process_metrics_with_pandas(metrics_data)
-    html_path = create_html_report(df, metrics_data)
-    report_key = upload_report_to_s3(bucket_name, html_path, metrics_data['month'])
+    rows = process_metrics(metrics_data)
+    html_bytes = create_html_report(rows, metrics_data)
+    report_key = upload_report_to_s3(bucket_name, html_bytes, metrics_data['month'])
     return report_key
 
 
 def download_metrics_data(bucket_name, data_key):
-    """Download and parse metrics data from S3."""
+    """Download and parse metrics data from S3, decompressing it if stored gzipped."""
     logger.info("Downloading metrics data from S3", extra={
         "bucket": bucket_name, "key": data_key
     })
 
     try:
         response = s3_client.get_object(Bucket=bucket_name, Key=data_key)
-        data = json.loads(response['Body'].read().decode('utf-8'))
+        body = response['Body']
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.GzipFile(fileobj=body)
+        data = json.load(body)
 
         logger.info("Successfully downloaded metrics data", extra={
             "instances_count": len(data.get('instances', [])),
@@ -90,12 +195,12 @@ def download_metrics_data(bucket_name, data_key):
         raise
 
 
-def process_metrics_with_pandas(metrics_data):
+def process_metrics(metrics_data):
     """
-    Process metrics data using pandas for analysis.
-    Now includes account_id, account_alias, and region columns for multi-account support.
+    Flatten metrics data into one row per instance per day.
+    Each row includes account_id, account_alias, and region for multi-account support.
     """
-    logger.info("Processing metrics data with pandas")
+    logger.info("Processing metrics data")
 
     rows = []
     for instance_data in metrics_data.get('instances', []):
@@ -116,214 +221,256 @@ def process_metrics_with_pandas(metrics_data):
                 'min_cpu': datapoint['minimum']
             })
 
-    expected_cols = [
-        'account_id', 'account_alias', 'region', 'instance_id',
-        'date', 'avg_cpu', 'max_cpu', 'min_cpu'
-    ]
-
-    if not rows:
-        df = pd.DataFrame(columns=expected_cols)
-    else:
-        df = pd.DataFrame(rows)
-        df['date'] = pd.to_datetime(df['date'])
-
-    logger.info("Successfully processed data with pandas", extra={
-        "rows": len(df),
-        "accounts": df['account_id'].nunique() if not df.empty else 0
+    logger.info("Successfully processed metrics data", extra={
+        "rows": len(rows),
+        "accounts": len({row['account_id'] for row in rows})
     })
-    return df
+    return rows
 
 
-def create_html_report(df, metrics_data):
+def create_html_report(rows, metrics_data):
     """
     Create HTML report with multi-account grouping.
+
+    Returns:
+        bytes: UTF-8 encoded HTML document
     """
     logger.info("Creating HTML report")
 
     try:
-        html_path = tempfile.mktemp(suffix='.html')
         month = metrics_data.get('month', 'Unknown Month')
-        is_multi_account = df['account_id'].nunique() > 1 if not df.empty else False
+        is_multi_account = len({row['account_id'] for row in rows}) > 1
 
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>CloudWatch CPU Utilization Report - {month}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #232F3E; text-align: center; }}
-        h2 {{ color: #FF9900; border-bottom: 2px solid #FF9900; padding-bottom: 5px; }}
-        h3 {{ color: #232F3E; margin-top: 30px; }}
-        .summary {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0; }}
-        .account-section {{ border-left: 4px solid #FF9900; padding-left: 20px; margin: 30px 0; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-        th {{ background-color: #232F3E; color: white; }}
-        tr:nth-child(even) {{ background-color: #f2f2f2; }}
-        .metric {{ display: inline-block; margin: 10px 20px; }}
-        .account-header {{ background-color: #232F3E; color: white; padding: 10px 20px; border-radius: 5px 5px 0 0; margin-top: 30px; }}
-    </style>
-</head>
-<body>
-    <h1>CloudWatch CPU Utilization Report</h1>
-    <h2>Report Period: {month}</h2>
-"""
+        # Sections append fragments to one list that is joined once at the end
+        out = [f"    <h2>Report Period: {escape(month)}</h2>\n"]
+
+        if rows:
+            # Aggregate once; every section below reads from these
+            account_rows = _group_rows(rows, 'account_id', 'account_alias')
+            summaries = summarize_instances(rows)
 
-        if not df.empty:
-            html_content += _build_executive_summary(df, is_multi_account)
+            _build_executive_summary(out, summaries, is_multi_account)
 
             if is_multi_account:
-                html_content += _build_account_overview_table(df)
+                _build_account_overview_table(out, summaries)
 
             # Per-account sections
-            for (account_id, account_alias), account_df in df.groupby(['account_id', 'account_alias']):
-                html_content += _build_account_section(account_id, account_alias, account_df, is_multi_account)
+            for (account_id, account_alias), rows_for_account in account_rows.items():
+                _build_account_section(
+                    out, account_id, account_alias, rows_for_account,
+                    summaries[(account_id, account_alias)], is_multi_account
+                )
 
-            html_content += _build_recommendations(df, is_multi_account)
+            _build_recommendations(out, summaries, is_multi_account)
         else:
-            html_content += """
+            out.append("""
     <div class="summary">
         <h2>No Data Available</h2>
         <p>No CPU utilization data was found for the specified time period.</p>
     </div>
-"""
+""")
 
-        html_content += f"""
+        out.append(f"""
     <div style="margin-top: 40px; text-align: center; color: #666; font-size: 12px;">
         Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')} by CloudWatch S3 Reporting System
     </div>
-</body>
-</html>"""
+""")
 
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_bytes = b''.join([
+            _HTML_HEAD_START,
+            escape(month).encode('utf-8'),
+            _HTML_HEAD_END,
+            ''.join(out).encode('utf-8'),
+            _HTML_TAIL
+        ])
 
-        logger.info("Successfully created HTML report", extra={"html_path": html_path})
-        return html_path
+        logger.info("Successfully created HTML report", extra={"size_bytes": len(html_bytes)})
+        return html_bytes
 
     except Exception as e:
         logger.error("Error creating HTML report", extra={"error": str(e)})
         raise
 
 
-def _build_executive_summary(df, is_multi_account):
+def _group_rows(rows, *keys):
+    """Group rows by the given keys, returning a dict sorted by group key."""
+    groups = defaultdict(list)
+    for row in rows:
+        group_key = tuple(row[key] for key in keys) if len(keys) > 1 else row[keys[0]]
+        groups[group_key].append(row)
+    return dict(sorted(groups.items()))
+
+
+def summarize_instances(rows):
+    """
+    Aggregate per-instance statistics in a single pass over the rows.
+
+    Returns:
+        Dict keyed by (account_id, account_alias), sorted by key, mapping to a dict
+        of instance_id -> stats (avg, std, max, min, count, regions). Instances keep
+        the order in which they first appear in the data.
+    """
+    accumulators = defaultdict(dict)
+    for row in rows:
+        instances = accumulators[(row['account_id'], row['account_alias'])]
+        acc = instances.get(row['instance_id'])
+        if acc is None:
+            acc = instances[row['instance_id']] = {
+                'avgs': [], 'max': row['max_cpu'], 'min': row['min_cpu'], 'regions': set()
+            }
+        acc['avgs'].append(row['avg_cpu'])
+        acc['max'] = max(acc['max'], row['max_cpu'])
+        acc['min'] = min(acc['min'], row['min_cpu'])
+        acc['regions'].add(row['region'])
+
+    summaries = {}
+    for account_key in sorted(accumulators):
+        summaries[account_key] = {}
+        for instance_id, acc in accumulators[account_key].items():
+            avgs = acc['avgs']
+            summaries[account_key][instance_id] = {
+                'avg': statistics.fmean(avgs),
+                'std': statistics.stdev(avgs) if len(avgs) > 1 else None,
+                'max': acc['max'],
+                'min': acc['min'],
+                'count': len(avgs),
+                'regions': acc['regions']
+            }
+    return summaries
+
+
+def _html_table(out, columns, table_rows, css_class):
+    """Append an iterable of row tuples to out as an HTML table, escaping cell values."""
+    out.append(f'<table border="1" class="dataframe {css_class}">\n    <thead>\n      <tr>')
+    out.extend(f'<th>{escape(column)}</th>' for column in columns)
+    out.append('</tr>\n    </thead>\n    <tbody>\n')
+    # One fragment per row, so no intermediate string holds the whole table body
+    out.extend(
+        '      <tr>' + ''.join(f'<td>{escape(str(value))}</td>' for value in row) + '</tr>\n'
+        for row in table_rows
+    )
+    out.append('    </tbody>\n</table>\n')
+
+
+def _overall_stats(instance_stats):
+    """Combine per-instance stats into (instance count, datapoint-weighted avg, max, min)."""
+    instance_stats = list(instance_stats)
+    total_points = sum(stats['count'] for stats in instance_stats)
+    avg_cpu = sum(stats['avg'] * stats['count'] for stats in instance_stats) / total_points
+    max_cpu = max(stats['max'] for stats in instance_stats)
+    min_cpu = min(stats['min'] for stats in instance_stats)
+    return len(instance_stats), avg_cpu, max_cpu, min_cpu
+
+
+def _build_executive_summary(out, summaries, is_multi_account):
     """Build the executive summary section."""
-    total_accounts = df['account_id'].nunique()
-    total_instances = df['instance_id'].nunique()
-    avg_cpu = df['avg_cpu'].mean()
-    max_cpu = df['max_cpu'].max()
-    min_cpu = df['min_cpu'].min()
+    total_accounts = len({account_id for account_id, _ in summaries})
+    total_instances, avg_cpu, max_cpu, min_cpu = _overall_stats(
+        stats for instances in summaries.values() for stats in instances.values()
+    )
 
-    html = """
+    out.append("""
     <div class="summary">
         <h2>Executive Summary</h2>
-"""
+""")
     if is_multi_account:
-        html += f'        <div class="metric">Total Accounts: <strong>{total_accounts}</strong></div>\n'
+        out.append(f'        <div class="metric">Total Accounts: <strong>{total_accounts}</strong></div>\n')
 
-    html += f"""        <div class="metric">Total Instances: <strong>{total_instances}</strong></div>
+    out.append(f"""        <div class="metric">Total Instances: <strong>{total_instances}</strong></div>
         <div class="metric">Overall Average CPU: <strong>{avg_cpu:.2f}%</strong></div>
         <div class="metric">Peak CPU Usage: <strong>{max_cpu:.2f}%</strong></div>
         <div class="metric">Minimum CPU Usage: <strong>{min_cpu:.2f}%</strong></div>
     </div>
-"""
-    return html
+""")
 
 
-def _build_account_overview_table(df):
+def _build_account_overview_table(out, summaries):
     """Build a cross-account summary table (only shown for multi-account reports)."""
-    account_summary = df.groupby(['account_id', 'account_alias']).agg({
-        'instance_id': 'nunique',
-        'avg_cpu': 'mean',
-        'max_cpu': 'max',
-        'min_cpu': 'min',
-        'region': lambda x: ', '.join(sorted(x.unique()))
-    }).round(2).reset_index()
-
-    account_summary.columns = [
+    table_rows = []
+    for (account_id, account_alias), instances in summaries.items():
+        instance_count, avg_cpu, max_cpu, min_cpu = _overall_stats(instances.values())
+        regions = set().union(*(stats['regions'] for stats in instances.values()))
+        table_rows.append((
+            account_id,
+            account_alias,
+            instance_count,
+            f"{avg_cpu:.2f}",
+            f"{max_cpu:.2f}",
+            f"{min_cpu:.2f}",
+            ', '.join(sorted(regions))
+        ))
+
+    columns = [
         'Account ID', 'Account Alias', 'Instances',
         'Avg CPU (%)', 'Max CPU (%)', 'Min CPU (%)', 'Regions'
     ]
 
-    html = "    <h2>Account Overview</h2>\n"
-    html += account_summary.to_html(classes='summary-table', escape=False, index=False)
-    html += "\n"
-    return html
+    out.append("    <h2>Account Overview</h2>\n")
+    _html_table(out, columns, table_rows, 'summary-table')
 
 
-def _build_account_section(account_id, account_alias, account_df, is_multi_account):
+def _build_account_section(out, account_id, account_alias, account_rows, instances, is_multi_account):
     """Build the per-account detail section with instance summary and daily data."""
     if is_multi_account:
-        label = f"{account_alias} ({account_id})"
-        html = f'    <div class="account-section">\n'
-        html += f'    <div class="account-header">{label}</div>\n'
-    else:
-        html = ""
+        label = escape(f"{account_alias} ({account_id})")
+        out.append('    <div class="account-section">\n')
+        out.append(f'    <div class="account-header">{label}</div>\n')
 
     # Instance summary table
-    instance_summary = account_df.groupby('instance_id').agg({
-        'avg_cpu': ['mean', 'std'],
-        'max_cpu': 'max',
-        'min_cpu': 'min',
-        'date': 'count'
-    }).round(2)
-
-    instance_summary.columns = ['Avg CPU (%)', 'CPU StdDev', 'Max CPU (%)', 'Min CPU (%)', 'Data Points']
-    instance_summary = instance_summary.reset_index()
-    instance_summary.columns = ['Instance ID'] + list(instance_summary.columns[1:])
-
-    html += "    <h3>Instance Summary</h3>\n"
-    html += instance_summary.to_html(classes='summary-table', escape=False, index=False)
-
-    # Daily detail table
-    df_display = account_df.copy()
-    df_display['avg_cpu'] = df_display['avg_cpu'].round(2)
-    df_display['max_cpu'] = df_display['max_cpu'].round(2)
-    df_display['min_cpu'] = df_display['min_cpu'].round(2)
-    df_display['date'] = df_display['date'].dt.strftime('%Y-%m-%d')
+    summary_rows = [
+        (
+            instance_id,
+            f"{stats['avg']:.2f}",
+            f"{stats['std']:.2f}" if stats['std'] is not None else 'N/A',
+            f"{stats['max']:.2f}",
+            f"{stats['min']:.2f}",
+            stats['count']
+        )
+        for instance_id, stats in sorted(instances.items())
+    ]
+    summary_columns = ['Instance ID', 'Avg CPU (%)', 'CPU StdDev', 'Max CPU (%)', 'Min CPU (%)', 'Data Points']
 
-    display_cols = ['instance_id', 'region', 'date', 'avg_cpu', 'max_cpu', 'min_cpu']
-    display_names = ['Instance ID', 'Region', 'Date', 'Average CPU (%)', 'Maximum CPU (%)', 'Minimum CPU (%)']
+    out.append("    <h3>Instance Summary</h3>\n")
+    _html_table(out, summary_columns, summary_rows, 'summary-table')
 
-    df_display = df_display[display_cols]
-    df_display.columns = display_names
+    # Daily detail table, rendered straight from the rows without a copy
+    detail_rows = (
+        (
+            row['instance_id'], row['region'], row['date'],
+            f"{row['avg_cpu']:.2f}", f"{row['max_cpu']:.2f}", f"{row['min_cpu']:.2f}"
+        )
+        for row in account_rows
+    )
+    detail_columns = ['Instance ID', 'Region', 'Date', 'Average CPU (%)', 'Maximum CPU (%)', 'Minimum CPU (%)']
 
-    html += "    <h3>Daily CPU Utilization</h3>\n"
-    html += df_display.to_html(classes='detail-table', escape=False, index=False)
+    out.append("    <h3>Daily CPU Utilization</h3>\n")
+    _html_table(out, detail_columns, detail_rows, 'detail-table')
 
     if is_multi_account:
-        html += "    </div>\n"
+        out.append("    </div>\n")
 
-    return html
 
-
-def _build_recommendations(df, is_multi_account):
+def _build_recommendations(out, summaries, is_multi_account):
     """Build the recommendations section, grouped by account if multi-account."""
-    html = "    <h2>Recommendations</h2>\n"
+    out.append("    <h2>Recommendations</h2>\n")
 
     if is_multi_account:
-        for (account_id, account_alias), account_df in df.groupby(['account_id', 'account_alias']):
-            html += f"    <h3>{account_alias} ({account_id})</h3>\n    <ul>\n"
-            html += _recommendations_for_instances(account_df)
-            html += "    </ul>\n"
+        for (account_id, account_alias), instances in summaries.items():
+            out.append(f"    <h3>{escape(f'{account_alias} ({account_id})')}</h3>\n    <ul>\n")
+            _recommendations_for_instances(out, instances)
+            out.append("    </ul>\n")
     else:
-        html += "    <ul>\n"
-        html += _recommendations_for_instances(df)
-        html += "    </ul>\n"
-
-    return html
+        out.append("    <ul>\n")
+        for instances in summaries.values():
+            _recommendations_for_instances(out, instances)
+        out.append("    </ul>\n")
 
 
-def _recommendations_for_instances(df):
-    """Generate recommendation list items for instances in a DataFrame."""
-    html = ""
-    for instance_id in df['instance_id'].unique():
-        instance_df = df[df['instance_id'] == instance_id]
-        avg_cpu = instance_df['avg_cpu'].mean()
-        max_cpu = instance_df['max_cpu'].max()
-        rec = generate_recommendations(avg_cpu, max_cpu)
-        html += f"        <li><strong>{instance_id}:</strong> {rec}</li>\n"
-    return html
+def _recommendations_for_instances(out, instances):
+    """Append recommendation list items from per-instance stats."""
+    for instance_id, stats in instances.items():
+        rec = generate_recommendations(stats['avg'], stats['max'])
+        out.append(f"        <li><strong>{escape(instance_id)}:</strong> {rec}</li>\n")
 
 
 def generate_recommendations(avg_cpu, max_cpu):
@@ -338,20 +485,20 @@ def generate_recommendations(avg_cpu, max_cpu):
         return "CPU utilization appears to be within normal ranges."
 
 
-def upload_report_to_s3(bucket_name, html_path, month):
+def upload_report_to_s3(bucket_name, html_bytes, month):
     """Upload HTML report to S3 reports folder."""
     logger.info("Uploading HTML report to S3")
 
     try:
         report_key = f"reports/{month}-report.html"
 
-        with open(html_path, 'rb') as html_file:
-            s3_client.put_object(
-                Bucket=bucket_name,
-                Key=report_key,
-                Body=html_file,
-                ContentType='text/html'
-            )
+        s3_client.upload_fileobj(
+            io.BytesIO(html_bytes),
+            bucket_name,
+            report_key,
+            ExtraArgs={'ContentType': 'text/html'},
+            Config=TRANSFER_CONFIG
+        )
 
         logger.info("Successfully uploaded HTML report to S3", extra={
             "bucket": bucket_name, "key": report_key
@@ -363,9 +510,6 @@ def upload_report_to_s3(bucket_name, html_path, month):
             "bucket": bucket_name, "error": str(e)
         })
         raise
-    finally:
-        if os.path.exists(html_path):
-            os.remove(html_path)
 
 
 def send_notification(bucket_name, report_key, success=True, error=None):